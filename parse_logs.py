@@ -7,9 +7,14 @@ Two windows: scrollable individual plots + fullscreen combined view.
 # pyright: reportAttributeAccessIssue=false
 # pyright: reportOptionalMemberAccess=false
 # pyright: reportArgumentType=false
+# pyright: reportOptionalCall=false
 
+import math
+import mmap
 import re
 import sys
+import time
+import zipfile
 import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
@@ -25,34 +30,319 @@ except ImportError:
     tk = None  # type: ignore
     ttk = None  # type: ignore
 
+HAS_NUMBA = False
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    njit = None  # type: ignore
+
+
+# Regex pattern for genetic optimizer log format
+# "Gen 123 - Fit: 16.1234 (mean=19.42, var=9.50, p95=25.0, max=45)"
+# Numbers use comma OR period as decimal separator (e.g., 8,78 or 8.78)
+# Patterns are compiled as bytes and run directly over the memory-mapped log
+_NUM = r'(\d+(?:[.,]\d+)?)'  # Matches: 123, 12.34, 12,34
+_GEN_PATTERN = rf'Gen\s+{_NUM}.*?Fit:\s*{_NUM}\s*\(mean={_NUM},\s*var={_NUM}(?:,\s*p95={_NUM},\s*max={_NUM})?'
+# Improvement markers
+_IMPROVEMENT_WORDS = (
+    'IMPROVEMENT', 'New best', 'Confirmed improvement', 'Accepting candidate', 'NEW BEST', 'GLOBAL BEST', 'BASELINE'
+)
+_IMPROVEMENT_PATTERN = rf'\*\*\*\s*({"|".join(_IMPROVEMENT_WORDS)})'
+_PARAM_RE = re.compile(rb'^[ \t]+(\w+) = (-?\d+(?:[.,]\d+)?)', re.MULTILINE)
+# Bytes before the scan position kept in a snapshot to recognise the log it was taken from
+_SNAPSHOT_TAIL = 4096
+# Translation table for comma decimal separators
+_COMMA_TO_DOT = bytes.maketrans(b',', b'.')
+# A generation line, or an improvement marker line followed by its indented block
+_BLOCK_RE = re.compile((
+    rf'(?:{_GEN_PATTERN})'
+    rf'|(?:{_IMPROVEMENT_PATTERN})[^\n]*\n(?P<params>(?:[ \t][^\n]*\n|\n)*)'
+).encode())
+# One tab20 color per known parameter, shared by both plotters
+_PALETTE = plt.cm.tab20(np.linspace(0, 1, 17))  # type: ignore
+
+
+if HAS_NUMBA:
+    # Compiled scanner for the same format as _BLOCK_RE / _PARAM_RE, walking the raw bytes.
+    # Global arrays are frozen into the compiled code as constants.
+    def _literal(text):
+        return np.frombuffer(text.encode(), dtype=np.uint8).copy()
+    
+    _LIT_GEN = _literal('Gen')
+    _LIT_FIT = _literal('Fit:')
+    _LIT_MEAN = _literal('(mean=')
+    _LIT_VAR = _literal('var=')
+    _LIT_P95 = _literal('p95=')
+    _LIT_MAX = _literal('max=')
+    _LIT_STARS = _literal('***')
+    _LIT_ASSIGN = _literal(' = ')
+    _MARKER_WORDS = _literal(''.join(_IMPROVEMENT_WORDS))
+    _MARKER_OFFSETS = np.cumsum([0] + [len(word) for word in _IMPROVEMENT_WORDS])
+    
+    @njit(cache=True)
+    def _starts_with(buf, pos, end, lit, lit_start, lit_end):
+        if pos + lit_end - lit_start > end:
+            return False
+        for k in range(lit_end - lit_start):
+            if buf[pos + k] != lit[lit_start + k]:
+                return False
+        return True
+    
+    @njit(cache=True)
+    def _skip_spaces(buf, pos, end):
+        # \s without the newline, since matches never span lines
+        while pos < end and (buf[pos] == 32 or 9 <= buf[pos] <= 13) and buf[pos] != 10:
+            pos += 1
+        return pos
+    
+    @njit(cache=True)
+    def _parse_num(buf, pos, end):
+        """Match \\d+(?:[.,]\\d+)? at pos. Returns (value, end of match); end == pos when there is none."""
+        mantissa = 0
+        i = pos
+        while i < end and 48 <= buf[i] <= 57:
+            mantissa = mantissa * 10 + (buf[i] - 48)
+            i += 1
+        if i == pos:
+            return 0.0, pos
+        scale = 1.0
+        if i + 1 < end and (buf[i] == 46 or buf[i] == 44) and 48 <= buf[i + 1] <= 57:
+            i += 1
+            while i < end and 48 <= buf[i] <= 57:
+                mantissa = mantissa * 10 + (buf[i] - 48)
+                scale *= 10.0
+                i += 1
+        # Exact integer over an exact power of ten rounds the same way as float()
+        return mantissa / scale, i
+    
+    @njit(cache=True)
+    def _match_gen(buf, pos, eol, state):
+        """Match the generation pattern at pos; on success store it in state and return the match end, else -1."""
+        if not _starts_with(buf, pos, eol, _LIT_GEN, 0, len(_LIT_GEN)):
+            return -1
+        i = pos + len(_LIT_GEN)
+        j = _skip_spaces(buf, i, eol)
+        if j == i:
+            return -1
+        gen, i = _parse_num(buf, j, eol)
+        if i == j:
+            return -1
+        # Lazy .*?Fit: -- try each following "Fit:" until the rest matches
+        for f in range(i, eol):
+            if not _starts_with(buf, f, eol, _LIT_FIT, 0, len(_LIT_FIT)):
+                continue
+            k = _skip_spaces(buf, f + len(_LIT_FIT), eol)
+            fit, k2 = _parse_num(buf, k, eol)
+            if k2 == k:
+                continue
+            k = _skip_spaces(buf, k2, eol)
+            if not _starts_with(buf, k, eol, _LIT_MEAN, 0, len(_LIT_MEAN)):
+                continue
+            k += len(_LIT_MEAN)
+            mean, k2 = _parse_num(buf, k, eol)
+            if k2 == k or k2 >= eol or buf[k2] != 44:
+                continue
+            k = _skip_spaces(buf, k2 + 1, eol)
+            if not _starts_with(buf, k, eol, _LIT_VAR, 0, len(_LIT_VAR)):
+                continue
+            k += len(_LIT_VAR)
+            var, k2 = _parse_num(buf, k, eol)
+            if k2 == k:
+                continue
+            match_end = k2
+            p95 = np.nan
+            max_turns = np.nan
+            # Optional ", p95=NUM, max=NUM"
+            if k2 < eol and buf[k2] == 44:
+                k = _skip_spaces(buf, k2 + 1, eol)
+                if _starts_with(buf, k, eol, _LIT_P95, 0, len(_LIT_P95)):
+                    p95_val, k3 = _parse_num(buf, k + len(_LIT_P95), eol)
+                    if k3 > k + len(_LIT_P95) and k3 < eol and buf[k3] == 44:
+                        k = _skip_spaces(buf, k3 + 1, eol)
+                        if _starts_with(buf, k, eol, _LIT_MAX, 0, len(_LIT_MAX)):
+                            max_val, k4 = _parse_num(buf, k + len(_LIT_MAX), eol)
+                            if k4 > k + len(_LIT_MAX):
+                                p95 = p95_val
+                                max_turns = max_val
+                                match_end = k4
+            state[0] = gen
+            state[1] = fit
+            state[2] = mean
+            state[3] = var
+            state[4] = p95
+            state[5] = max_turns
+            return match_end
+        return -1
+    
+    @njit(cache=True)
+    def _match_marker(buf, pos, eol):
+        if not _starts_with(buf, pos, eol, _LIT_STARS, 0, len(_LIT_STARS)):
+            return False
+        i = pos + len(_LIT_STARS)
+        while i < eol and (buf[i] == 32 or 9 <= buf[i] <= 13):
+            i += 1
+        for w in range(len(_MARKER_OFFSETS) - 1):
+            if _starts_with(buf, i, eol, _MARKER_WORDS, _MARKER_OFFSETS[w], _MARKER_OFFSETS[w + 1]):
+                return True
+        return False
+    
+    @njit(cache=True)
+    def _match_param(buf, pos, eol):
+        """Match ^[ \\t]+(\\w+) = (-?NUM) on the line at pos. Returns (name_start, name_end, value) or name_start -1."""
+        i = pos
+        while i < eol and (buf[i] == 32 or buf[i] == 9):
+            i += 1
+        if i == pos:
+            return -1, -1, 0.0
+        name_start = i
+        while i < eol and (48 <= buf[i] <= 57 or 65 <= buf[i] <= 90 or 97 <= buf[i] <= 122 or buf[i] == 95):
+            i += 1
+        name_end = i
+        if name_end == name_start or not _starts_with(buf, i, eol, _LIT_ASSIGN, 0, len(_LIT_ASSIGN)):
+            return -1, -1, 0.0
+        i += len(_LIT_ASSIGN)
+        sign = 1.0
+        if i < eol and buf[i] == 45:
+            sign = -1.0
+            i += 1
+        value, j = _parse_num(buf, i, eol)
+        if j == i:
+            return -1, -1, 0.0
+        return name_start, name_end, sign * value
+    
+    @njit(cache=True)
+    def scan_log(buf, start, end, state, n_required, imp_state, imp_param_end, name_starts, name_ends, values):
+        """Scan complete lines in buf[start:end] for generation lines and improvement blocks.
+        
+        state holds the latest (gen, fit, mean, var, p95, max) and is updated in place (NaN = not logged).
+        An improvement block ending at end counts as complete once it has n_required parameters.
+        Each improvement gets a row in imp_state and the end index of its parameters in
+        imp_param_end; parameters are (name_starts, name_ends, values) spans into buf.
+        
+        Returns (status, next_pos, n_improvements): status 0 = done, 1 = stopped at an improvement
+        block that may be incomplete, 2 = output buffers full. Scanning resumes at next_pos.
+        """
+        n_imp = 0
+        n_par = 0
+        line = start
+        while line < end:
+            eol = line
+            while buf[eol] != 10:
+                eol += 1
+            
+            i = line
+            block_start = -1
+            while i < eol:
+                # Cheap first-byte test before the full matchers
+                c = buf[i]
+                if c == _LIT_GEN[0]:
+                    gen_end = _match_gen(buf, i, eol, state)
+                    if gen_end >= 0:
+                        i = gen_end
+                        continue
+                elif c == _LIT_STARS[0] and _match_marker(buf, i, eol):
+                    block_start = eol + 1
+                    break
+                i += 1
+            
+            if block_start < 0:
+                line = eol + 1
+                continue
+            
+            marker_pos = i
+            # Indented or empty lines following the marker belong to its block
+            block_end = block_start
+            while block_end < end and (buf[block_end] == 32 or buf[block_end] == 9 or buf[block_end] == 10):
+                while buf[block_end] != 10:
+                    block_end += 1
+                block_end += 1
+            if n_imp == len(imp_param_end):
+                return 2, marker_pos, n_imp
+            
+            first_par = n_par
+            p = block_start
+            while p < block_end:
+                p_eol = p
+                while buf[p_eol] != 10:
+                    p_eol += 1
+                name_start, name_end, value = _match_param(buf, p, p_eol)
+                if name_start >= 0:
+                    if n_par == len(values):
+                        return 2, marker_pos, n_imp
+                    name_starts[n_par] = name_start
+                    name_ends[n_par] = name_end
+                    values[n_par] = value
+                    n_par += 1
+                p = p_eol + 1
+            
+            # A block running to the end of the scanned range may still be missing parameter
+            # lines; the optimizer prints each parameter once, so only a short block waits
+            if block_end == end and n_par - first_par < n_required:
+                return 1, marker_pos, n_imp
+            
+            if n_par > first_par:
+                imp_state[n_imp, :] = state
+                imp_param_end[n_imp] = n_par
+                n_imp += 1
+            line = block_end
+        return 0, end, n_imp
+
+
+class GrowableArray:
+    """Preallocated NumPy buffer (float64 by default) that doubles its capacity when full."""
+    
+    def __init__(self, capacity=64, dtype=np.float64):
+        self._buf = np.empty(capacity, dtype=dtype)
+        self._len = 0
+        self._cap = capacity
+    
+    def __len__(self):
+        return self._len
+    
+    def append(self, value):
+        """Append a value, growing the buffer geometrically when needed."""
+        if self._len == self._cap:
+            self._cap *= 2
+            grown = np.empty(self._cap, dtype=self._buf.dtype)
+            grown[:self._len] = self._buf[:self._len]
+            self._buf = grown
+        self._buf[self._len] = value
+        self._len += 1
+    
+    def extend(self, values):
+        """Append an array of values, growing the buffer to fit them."""
+        length = self._len + len(values)
+        if length > self._cap:
+            while self._cap < length:
+                self._cap *= 2
+            grown = np.empty(self._cap, dtype=self._buf.dtype)
+            grown[:self._len] = self._buf[:self._len]
+            self._buf = grown
+        self._buf[self._len:length] = values
+        self._len = length
+    
+    def view(self):
+        """Return a view of the filled part of the buffer (no copy)."""
+        return self._buf[:self._len]
+
 
 class LogParser:
     """Incremental log file parser that tracks position and only parses new content."""
     
     def __init__(self, filepath):
         self.filepath = Path(filepath)
-        self.file_position = 0
-        self.improvements = []
+        self.file_position = 0  # Byte offset where the next scan starts
+        self.mapped_size = 0  # File size when the log was last mapped
         self.last_gen = 0
         self.last_fitness = None
         self.last_mean = None
         self.last_variance = None
         self.last_p95 = None
         self.last_max = None
-        self.partial_line = ""
-        
-        # Regex pattern for genetic optimizer log format
-        # "Gen 123 - Fit: 16.1234 (mean=19.42, var=9.50, p95=25.0, max=45)"
-        # Numbers use comma OR period as decimal separator (e.g., 8,78 or 8.78)
-        num = r'(\d+(?:[.,]\d+)?)'  # Matches: 123, 12.34, 12,34
-        self.gen_pattern = re.compile(
-            rf'Gen\s+{num}.*?Fit:\s*{num}\s*\(mean={num},\s*var={num}(?:,\s*p95={num},\s*max={num})?'
-        )
-        # Improvement markers
-        self.improvement_marker = re.compile(
-            r'\*\*\*\s*(IMPROVEMENT|New best|Confirmed improvement|Accepting candidate|NEW BEST|GLOBAL BEST|BASELINE)'
-        )
-        self.param_pattern = re.compile(r'^\s+(\w+) = ([-\d,\.]+)')
+        self.file_handle = None
+        self.log_map = None
+        self.scan_buffers = None  # Output buffers reused by the Numba scanner
         
         # Parameter names in order
         self.param_names = [
@@ -62,101 +352,296 @@ class LogParser:
             "RemainingValueWeight", "EfficiencyWeight", "CommitmentRiskWeight", "MultiCollectThreshold",
             "ContinuationWeight"
         ]
+        
+        # Column buffers, one row per improvement (NaN where a metric is missing)
+        self.gen_arr = GrowableArray()
+        self.fit_arr = GrowableArray()
+        self.mean_arr = GrowableArray()
+        self.var_arr = GrowableArray()
+        self.p95_arr = GrowableArray()
+        self.max_arr = GrowableArray()
+        # Per-parameter buffers addressed by column index, only for improvements that logged the
+        # parameter: generation, value and row (improvement index) of each entry.
+        # Parameters not listed above get a column on first sight.
+        self.param_index = {name: i for i, name in enumerate(self.param_names)}
+        self.param_gens = [GrowableArray() for _ in self.param_names]
+        self.param_vals = [GrowableArray() for _ in self.param_names]
+        self.param_rows = [GrowableArray(dtype=np.int64) for _ in self.param_names]
+        # Running minimum of each metric (inf until the metric is first logged)
+        self.best = {'fitness': math.inf, 'mean': math.inf, 'variance': math.inf, 'p95': math.inf, 'max': math.inf}
+        # Snapshot of the parsed state, reused by the next session while the log is only appended to
+        self.snapshot_path = Path(str(self.filepath) + '.cache.npz')
     
     @staticmethod
     def parse_number(s):
-        """Parse number with comma as decimal separator."""
-        # Replace comma decimal separator, then strip any trailing periods
-        return float(s.replace(',', '.').rstrip('.'))
+        """Parse number (str or bytes) with comma as decimal separator."""
+        # The number patterns never capture a trailing separator, so one translate pass suffices
+        return float(s.translate(_COMMA_TO_DOT))
     
-    def parse_incremental(self):
-        """Parse only new content since last read. Returns True if new improvements found."""
+    def commit_improvement(self, params):
+        """Record an improvement with the most recent generation stats."""
+        row = len(self.gen_arr)
+        self.gen_arr.append(self.last_gen)
+        self.fit_arr.append(np.nan if self.last_fitness is None else self.last_fitness)
+        self.mean_arr.append(np.nan if self.last_mean is None else self.last_mean)
+        self.var_arr.append(np.nan if self.last_variance is None else self.last_variance)
+        self.p95_arr.append(np.nan if self.last_p95 is None else self.last_p95)
+        self.max_arr.append(np.nan if self.last_max is None else self.last_max)
         
-        if not self.filepath.exists():
-            return False
+        for key, value in (('fitness', self.last_fitness), ('mean', self.last_mean), ('variance', self.last_variance),
+                           ('p95', self.last_p95), ('max', self.last_max)):
+            if value is not None and value < self.best[key]:
+                self.best[key] = value
         
-        new_improvements_count = len(self.improvements)
+        for name, value in params.items():
+            idx = self.param_index.get(name)
+            if idx is None:
+                idx = self.param_index[name] = len(self.param_gens)
+                self.param_gens.append(GrowableArray())
+                self.param_vals.append(GrowableArray())
+                self.param_rows.append(GrowableArray(dtype=np.int64))
+            self.param_gens[idx].append(self.last_gen)
+            self.param_vals[idx].append(value)
+            self.param_rows[idx].append(row)
+    
+    def improvement(self, row):
+        """Reassemble one improvement as a dict from the column buffers."""
+        def column_value(arr):
+            value = arr.view()[row]
+            return None if math.isnan(value) else float(value)
         
-        with open(self.filepath, 'r', encoding='utf-8') as f:
-            f.seek(self.file_position)
-            new_content = f.read()
-            self.file_position = f.tell()
+        params = {}
+        for name, idx in self.param_index.items():
+            rows = self.param_rows[idx].view()
+            i = np.searchsorted(rows, row)
+            if i < len(rows) and rows[i] == row:
+                params[name] = float(self.param_vals[idx].view()[i])
         
-        if not new_content:
+        return {
+            'generation': int(self.gen_arr.view()[row]),
+            'fitness': column_value(self.fit_arr),
+            'mean': column_value(self.mean_arr),
+            'variance': column_value(self.var_arr),
+            'p95': column_value(self.p95_arr),
+            'max': column_value(self.max_arr),
+            'params': params
+        }
+    
+    def close(self):
+        """Release the log mapping and file handle if they are open."""
+        # The mapping is dropped rather than closed: close() raises while any buffer export is
+        # still alive (Numba holds one while compiling the scanner), and it is unmapped once freed
+        self.log_map = None
+        if self.file_handle is not None:
+            self.file_handle.close()
+            self.file_handle = None
+    
+    def save_snapshot(self):
+        """Write the parsed columns and scan position next to the log for the next session."""
+        if self.file_position == 0:
+            return
+        # The bytes just before the scan position identify the log this snapshot belongs to
+        with open(self.filepath, 'rb') as f:
+            f.seek(max(0, self.file_position - _SNAPSHOT_TAIL))
+            tail = f.read(self.file_position - f.tell())
+        state = [self.last_gen] + [np.nan if v is None else v for v in (
+            self.last_fitness, self.last_mean, self.last_variance, self.last_p95, self.last_max
+        )]
+        # Parameter buffers are ragged, so they are stored end to end with a count per column
+        with open(self.snapshot_path, 'wb') as f:
+            np.savez(
+                f,
+                file_position=self.file_position,
+                tail=np.frombuffer(tail, dtype=np.uint8),
+                state=np.array(state, dtype=np.float64),
+                columns=np.stack([arr.view() for arr in (
+                    self.gen_arr, self.fit_arr, self.mean_arr, self.var_arr, self.p95_arr, self.max_arr
+                )]),
+                param_names=np.array(list(self.param_index)),
+                param_counts=np.array([len(arr) for arr in self.param_rows], dtype=np.int64),
+                param_gens=np.concatenate([arr.view() for arr in self.param_gens]),
+                param_vals=np.concatenate([arr.view() for arr in self.param_vals]),
+                param_rows=np.concatenate([arr.view() for arr in self.param_rows]),
+            )
+    
+    def load_snapshot(self):
+        """Resume from a snapshot of an earlier session if the log still starts with the snapshotted content.
+        
+        Must be called before the first parse. Returns True if the snapshot was loaded.
+        """
+        # Everything is read and checked before any parser state changes, so a stale or
+        # foreign snapshot is ignored as a whole
+        try:
+            with np.load(self.snapshot_path) as snapshot:
+                position = int(snapshot['file_position'])
+                tail = snapshot['tail'].tobytes()
+                state = snapshot['state']
+                columns = snapshot['columns']
+                param_names = snapshot['param_names']
+                param_counts = snapshot['param_counts']
+                param_gens = snapshot['param_gens']
+                param_vals = snapshot['param_vals']
+                param_rows = snapshot['param_rows']
+            total = param_counts.sum()
+            if (state.shape != (6,) or columns.ndim != 2 or len(columns) != 6
+                    or param_names.ndim != 1 or param_names.dtype.kind != 'U'
+                    or param_counts.shape != param_names.shape or (param_counts < 0).any()
+                    or not len(param_gens) == len(param_vals) == len(param_rows) == total):
+                return False
+            with open(self.filepath, 'rb') as f:
+                f.seek(position - len(tail))
+                if f.read(len(tail)) != tail:
+                    return False
+        except (OSError, EOFError, ValueError, KeyError, zipfile.BadZipFile):
             return False
         
-        # Handle partial lines from previous read
-        content = self.partial_line + new_content
-        lines = content.split('\n')
+        for arr, column in zip((self.gen_arr, self.fit_arr, self.mean_arr, self.var_arr, self.p95_arr, self.max_arr),
+                               columns):
+            arr.extend(column)
         
-        # Last line might be incomplete
-        if not new_content.endswith('\n'):
-            self.partial_line = lines[-1]
-            lines = lines[:-1]
-        else:
-            self.partial_line = ""
+        bounds = np.cumsum(param_counts)
+        for name, gens, vals, rows in zip(param_names.tolist(),
+                                          np.split(param_gens, bounds[:-1]),
+                                          np.split(param_vals, bounds[:-1]),
+                                          np.split(param_rows, bounds[:-1])):
+            idx = self.param_index.get(name)
+            if idx is None:
+                idx = self.param_index[name] = len(self.param_gens)
+                self.param_gens.append(GrowableArray())
+                self.param_vals.append(GrowableArray())
+                self.param_rows.append(GrowableArray(dtype=np.int64))
+            self.param_gens[idx].extend(gens)
+            self.param_vals[idx].extend(vals)
+            self.param_rows[idx].extend(rows)
         
-        i = 0
-        while i < len(lines):
-            line = lines[i]
+        for key, arr in (('fitness', self.fit_arr), ('mean', self.mean_arr), ('variance', self.var_arr),
+                         ('p95', self.p95_arr), ('max', self.max_arr)):
+            values = arr.view()[~np.isnan(arr.view())]
+            if values.size:
+                self.best[key] = float(values.min())
+        
+        self.set_last(state)
+        self.file_position = position
+        return True
+    
+    def scan_regex(self, log_map, start, end):
+        """Scan complete lines in log_map between start and end with the block regexes."""
+        for match in _BLOCK_RE.finditer(log_map, start, end):
+            # Generation line
+            if match.group(1) is not None:
+                self.last_gen = int(match.group(1))
+                self.last_fitness = self.parse_number(match.group(2))
+                self.last_mean = self.parse_number(match.group(3))
+                self.last_variance = self.parse_number(match.group(4))
+                # P95 and max are optional (groups 5 and 6)
+                self.last_p95 = self.parse_number(match.group(5)) if match.group(5) else None
+                self.last_max = self.parse_number(match.group(6)) if match.group(6) else None
+                continue
             
-            # Check for generation line
-            gen_match = self.gen_pattern.search(line)
+            # Parameter lines are read in place over the block's span, without copying it out
+            params = {}
+            for param_match in _PARAM_RE.finditer(log_map, match.start('params'), match.end('params')):
+                params[param_match.group(1).decode('ascii')] = self.parse_number(param_match.group(2))
             
-            if gen_match:
-                self.last_gen = int(gen_match.group(1))
-                self.last_fitness = self.parse_number(gen_match.group(2))
-                self.last_mean = self.parse_number(gen_match.group(3))
-                self.last_variance = self.parse_number(gen_match.group(4))
-                # P95 and max are optional (groups 5 and 6)
-                self.last_p95 = self.parse_number(gen_match.group(5)) if gen_match.group(5) else None
-                self.last_max = self.parse_number(gen_match.group(6)) if gen_match.group(6) else None
+            # Improvement marker: a block running to the end of the scanned range may still be
+            # missing parameter lines; the optimizer prints all parameters, so only a block
+            # short of some of them is rescanned next time
+            if match.end() == end and not all(name in params for name in self.param_names):
+                self.file_position = match.start()
+                break
             
-            # Check for improvement marker
-            if self.improvement_marker.search(line):
-                # Look for parameters in following lines
+            if params:
+                self.commit_improvement(params)
+    
+    def scan_compiled(self, log_map, start, end):
+        """Scan complete lines in log_map between start and end with the Numba scanner."""
+        if self.scan_buffers is None:
+            self.scan_buffers = (
+                np.empty((4096, 6)), np.empty(4096, dtype=np.int64),
+                np.empty(65536, dtype=np.int64), np.empty(65536, dtype=np.int64), np.empty(65536)
+            )
+        imp_state, imp_param_end, name_starts, name_ends, values = self.scan_buffers
+        state = np.array([
+            self.last_gen,
+            *(np.nan if v is None else v for v in (
+                self.last_fitness, self.last_mean, self.last_variance, self.last_p95, self.last_max
+            ))
+        ], dtype=np.float64)
+        
+        buf = np.frombuffer(log_map, dtype=np.uint8)
+        status = 2
+        while status == 2:
+            status, start, n_imp = scan_log(buf, start, end, state, len(self.param_names), *self.scan_buffers)
+            first_par = 0
+            for row in range(n_imp):
                 params = {}
-                j = i + 1
-                while j < len(lines) and j < i + 20:
-                    param_match = self.param_pattern.match(lines[j])
-                    if param_match:
-                        param_name = param_match.group(1)
-                        param_value = self.parse_number(param_match.group(2))
-                        params[param_name] = param_value
-                    elif lines[j].strip() and not lines[j].startswith(' '):
-                        break
-                    j += 1
-                
-                if params:
-                    self.improvements.append({
-                        'generation': self.last_gen,
-                        'fitness': self.last_fitness,
-                        'mean': self.last_mean,
-                        'variance': self.last_variance,
-                        'p95': self.last_p95,
-                        'max': self.last_max,
-                        'params': params
-                    })
-            
-            i += 1
+                for k in range(first_par, imp_param_end[row]):
+                    params[log_map[name_starts[k]:name_ends[k]].decode('ascii')] = float(values[k])
+                first_par = imp_param_end[row]
+                self.set_last(imp_state[row])
+                self.commit_improvement(params)
+        
+        self.set_last(state)
+        if status == 1:
+            self.file_position = start
+    
+    def set_last(self, state):
+        """Set the latest generation stats from a (gen, fit, mean, var, p95, max) row, NaN meaning not logged."""
+        self.last_gen = int(state[0])
+        self.last_fitness, self.last_mean, self.last_variance, self.last_p95, self.last_max = (
+            None if math.isnan(v) else float(v) for v in state[1:]
+        )
+    
+    def parse_incremental(self):
+        """Parse only new content since last read. Returns True if new improvements found."""
+        
+        # Skip the scan entirely unless the file has grown
+        try:
+            size = self.filepath.stat().st_size
+        except OSError:
+            return False
+        if size <= self.mapped_size:
+            return False
+        
+        new_improvements_count = len(self.gen_arr)
+        
+        # Read-only mappings cannot grow, so remap the whole file; the OS pages in only what is scanned
+        if self.file_handle is None:
+            self.file_handle = open(self.filepath, 'rb')
+        self.log_map = None  # Released rather than closed, see close()
+        log_map = self.log_map = mmap.mmap(self.file_handle.fileno(), 0, access=mmap.ACCESS_READ)
+        self.mapped_size = len(log_map)
+        
+        # Only complete lines are scanned; an unfinished last line is picked up next time
+        end = log_map.rfind(b'\n', self.file_position) + 1
+        if end <= self.file_position:
+            return False
+        start = self.file_position
+        self.file_position = end
         
-        return len(self.improvements) > new_improvements_count
+        if HAS_NUMBA:
+            self.scan_compiled(log_map, start, end)
+        else:
+            self.scan_regex(log_map, start, end)
+        
+        return len(self.gen_arr) > new_improvements_count
 
 
 class ScrollablePlotter:
     """Tkinter-based scrollable plot window with fixed-height plots."""
     
-    def __init__(self, parser, update_interval_ms=2000):
+    def __init__(self, parser, update_interval_ms=2000, max_draw_interval_s=5.0, autoscale_interval_s=10.0):
         self.parser = parser
         self.update_interval = update_interval_ms
+        self.max_draw_interval = max_draw_interval_s
+        self.autoscale_interval = autoscale_interval_s
         self.last_improvement_count = 0
+        self.last_draw_time = 0.0
+        self.last_autoscale_time = 0.0
         self.running = True  # Flag to stop updates on window close
         
-        # Suppress matplotlib warning for many figures
-        plt.rcParams['figure.max_open_warning'] = 50
-        
         # Colors for plots
-        self.colors = plt.cm.tab20(np.linspace(0, 1, len(parser.param_names)))  # type: ignore
+        self.colors = _PALETTE
         
         # Tkinter setup
         self.root = tk.Tk()
@@ -172,6 +657,10 @@ class ScrollablePlotter:
         self.lines = {}
         self.combined_lines = {}
         
+        # Blitting state: artists redrawn on every update, and the static background per canvas
+        self.animated_artists = {}
+        self.backgrounds = {}
+        
         # Left pane: scrollable individual plots
         self.setup_scrollable_frame()
         
@@ -181,6 +670,11 @@ class ScrollablePlotter:
         # Create all the plots
         self.create_plots()
         
+        # Parameter artists by column index, in the order of the parser's parameter buffers
+        self.param_axes = [self.axes[param] for param in self.parser.param_names]
+        self.param_lines = [self.lines[param] for param in self.parser.param_names]
+        self.combined_param_lines = [self.combined_lines[param] for param in self.parser.param_names]
+        
     def setup_scrollable_frame(self):
         """Create scrollable frame for individual plots."""
         # Frame for scrollable content
@@ -230,11 +724,66 @@ class ScrollablePlotter:
         self.combined_ax.set_ylabel('Parameter Value', fontsize=14)
         self.combined_ax.tick_params(axis='both', labelsize=12)
         self.combined_ax.grid(True, alpha=0.3)
-        self.combined_ax.legend(loc='upper left', fontsize=11, ncol=2)
-        self.combined_ax.axhline(y=0, color='gray', linestyle='--', alpha=0.5, linewidth=2)
+        zero_line = self.combined_ax.axhline(y=0, color='gray', linestyle='--', alpha=0.5, linewidth=2)
+        
+        # Legend lives on its own axes below the plot, so it stays in the cached background
+        self.combined_ax.set_position((0.12, 0.36, 0.83, 0.56))
+        legend_ax = self.combined_fig.add_axes((0.02, 0.01, 0.96, 0.25), frame_on=False)
+        legend_ax.set_axis_off()
+        legend_ax.legend(handles=list(self.combined_lines.values()), loc='center', fontsize=11, ncol=3)
+        
+        self.register_animated(
+            self.combined_canvas,
+            [*self.combined_lines.values(), zero_line, self.combined_fig._suptitle]
+        )
+        
+    def register_animated(self, canvas, artists):
+        """Mark artists as animated so they are blitted over the canvas's cached background."""
+        for artist in artists:
+            artist.set_animated(True)
+        self.animated_artists[canvas] = artists
+        canvas.mpl_connect('draw_event', self.on_draw)
+    
+    def on_draw(self, event):
+        """Cache the static background after a full draw, then paint the animated artists on top."""
+        canvas = event.canvas
+        self.backgrounds[canvas] = canvas.copy_from_bbox(canvas.figure.bbox)
+        for artist in self.animated_artists[canvas]:
+            canvas.figure.draw_artist(artist)
+    
+    def blit(self, canvas):
+        """Redraw only the animated artists of a canvas over its cached background."""
+        canvas.restore_region(self.backgrounds[canvas])
+        for artist in self.animated_artists[canvas]:
+            canvas.figure.draw_artist(artist)
+        canvas.blit(canvas.figure.bbox)
+    
+    @staticmethod
+    def update_limits(ax, x, y, autoscale):
+        """Fit the view limits to the data. Returns True if the limits changed.
+        
+        With autoscale the limits are recomputed from scratch; otherwise they only
+        grow, with 10% padding, when the data leaves the current view.
+        """
+        if autoscale:
+            ax.relim()
+            ax.autoscale_view()
+            return True
+        
+        changed = False
+        for lo, hi, get_lim, set_lim in (
+            (np.nanmin(x), np.nanmax(x), ax.get_xlim, ax.set_xlim),
+            (np.nanmin(y), np.nanmax(y), ax.get_ylim, ax.set_ylim),
+        ):
+            cur_lo, cur_hi = get_lim()
+            if lo < cur_lo or hi > cur_hi:
+                pad = 0.1 * ((hi - lo) or 1.0)
+                set_lim(lo - pad if lo < cur_lo else cur_lo, hi + pad if hi > cur_hi else cur_hi)
+                changed = True
+        return changed
         
     def create_plots(self):
-        """Create all individual plots in the scrollable frame."""
+        """Create all individual plots as panels of one figure in the scrollable frame."""
         plot_height = 2.5  # Fixed height for each plot
         plot_width = 8
         
@@ -247,9 +796,13 @@ class ScrollablePlotter:
             ('max', 'Max Turns (worst case)', 'brown'),
         ]
         
+        # One figure hosts every panel, so a tick is a single draw on a single canvas
+        n_panels = len(metrics) + len(self.parser.param_names)
+        self.individual_fig = plt.figure(figsize=(plot_width, plot_height * n_panels))
+        
         # Create metric plots
-        for metric, title, color in metrics:
-            fig, ax = plt.subplots(figsize=(plot_width, plot_height))
+        for i, (metric, title, color) in enumerate(metrics):
+            ax = self.individual_fig.add_subplot(n_panels, 1, i + 1)
             line, = ax.plot([], [], '-o', color=color, markersize=6, linewidth=2.5)
             ax.set_xlabel('Generation', fontsize=12)
             ax.set_ylabel(metric.capitalize(), fontsize=12)
@@ -259,16 +812,13 @@ class ScrollablePlotter:
             
             self.axes[metric] = ax
             self.lines[metric] = line
-            
-            canvas = FigureCanvasTkAgg(fig, master=self.scrollable_frame)
-            canvas.draw()
-            canvas.get_tk_widget().pack(fill=tk.X, padx=5, pady=5)
         
         # Create parameter plots
+        zero_lines = []
         for idx, param in enumerate(self.parser.param_names):
-            fig, ax = plt.subplots(figsize=(plot_width, plot_height))
+            ax = self.individual_fig.add_subplot(n_panels, 1, len(metrics) + idx + 1)
             line, = ax.plot([], [], '-o', color=self.colors[idx], markersize=6, linewidth=2.5)
-            ax.axhline(y=0, color='gray', linestyle='--', alpha=0.5, linewidth=1.5)
+            zero_lines.append(ax.axhline(y=0, color='gray', linestyle='--', alpha=0.5, linewidth=1.5))
             ax.set_xlabel('Generation', fontsize=12)
             ax.set_ylabel('Value', fontsize=12)
             ax.set_title(param, fontsize=14, fontweight='bold')
@@ -277,10 +827,17 @@ class ScrollablePlotter:
             
             self.axes[param] = ax
             self.lines[param] = line
-            
-            canvas = FigureCanvasTkAgg(fig, master=self.scrollable_frame)
-            canvas.draw()
-            canvas.get_tk_widget().pack(fill=tk.X, padx=5, pady=5)
+        
+        # Lay out once up front rather than on every draw
+        self.individual_fig.tight_layout()
+        
+        canvas = FigureCanvasTkAgg(self.individual_fig, master=self.scrollable_frame)
+        self.register_animated(
+            canvas,
+            [*self.lines.values(), *zero_lines, *(ax.title for ax in self.axes.values())]
+        )
+        canvas.draw()
+        canvas.get_tk_widget().pack(fill=tk.X, padx=5, pady=5)
     
     def update(self):
         """Update all plots with new data."""
@@ -289,102 +846,122 @@ class ScrollablePlotter:
             
         self.parser.parse_incremental()
         
-        improvements = self.parser.improvements
-        if not improvements:
+        n = len(self.parser.gen_arr)
+        if n == 0:
             if self.running:
                 self.root.after(self.update_interval, self.update)
             return
         
         # Only update if we have new data
-        if len(improvements) == self.last_improvement_count:
+        if n == self.last_improvement_count:
+            if self.running:
+                self.root.after(self.update_interval, self.update)
+            return
+        
+        # Skip redraws for a handful of new points on a long history, unless the last draw is stale
+        delta = n - self.last_improvement_count
+        if delta < max(1, n // 200) and time.monotonic() - self.last_draw_time < self.max_draw_interval:
             if self.running:
                 self.root.after(self.update_interval, self.update)
             return
         
-        self.last_improvement_count = len(improvements)
+        self.last_improvement_count = n
+        self.last_draw_time = time.monotonic()
+        dirty_canvases = set()  # Each canvas is redrawn once, however many of its axes changed
+        stale_canvases = set()  # Canvases whose view limits changed and need a full draw
+        
+        # Full relim/autoscale only on a slow timer; in between, limits only grow when data leaves the view
+        autoscale = self.last_draw_time - self.last_autoscale_time >= self.autoscale_interval
+        if autoscale:
+            self.last_autoscale_time = self.last_draw_time
         
-        # Extract data
-        generations = [imp['generation'] for imp in improvements]
-        fitness_values = [imp['fitness'] for imp in improvements]
-        mean_values = [imp['mean'] for imp in improvements if imp['mean'] is not None]
-        variance_values = [imp['variance'] for imp in improvements if imp['variance'] is not None]
-        p95_values = [imp['p95'] for imp in improvements if imp.get('p95') is not None]
-        max_values = [imp['max'] for imp in improvements if imp.get('max') is not None]
-        mean_gens = [imp['generation'] for imp in improvements if imp['mean'] is not None]
-        var_gens = [imp['generation'] for imp in improvements if imp['variance'] is not None]
-        p95_gens = [imp['generation'] for imp in improvements if imp.get('p95') is not None]
-        max_gens = [imp['generation'] for imp in improvements if imp.get('max') is not None]
+        # Views over the parser's column buffers (missing metrics are NaN and not drawn)
+        generations = self.parser.gen_arr.view()
+        fitness_values = self.parser.fit_arr.view()
+        mean_values = self.parser.mean_arr.view()
+        variance_values = self.parser.var_arr.view()
+        p95_values = self.parser.p95_arr.view()
+        max_values = self.parser.max_arr.view()
         
         # Update fitness plot
         self.lines['fitness'].set_data(generations, fitness_values)
         ax = self.axes['fitness']
-        ax.relim()
-        ax.autoscale_view()
-        ax.set_title(f'Fitness (n={len(improvements)}, best={min(fitness_values):.4f})')
-        ax.figure.canvas.draw_idle()
+        if self.update_limits(ax, generations, fitness_values, autoscale):
+            stale_canvases.add(ax.figure.canvas)
+        ax.set_title(f'Fitness (n={n}, best={self.parser.best["fitness"]:.4f})')
+        dirty_canvases.add(ax.figure.canvas)
         
         # Update mean plot
-        if mean_values:
-            self.lines['mean'].set_data(mean_gens, mean_values)
+        if self.parser.best['mean'] < math.inf:
+            self.lines['mean'].set_data(generations, mean_values)
             ax = self.axes['mean']
-            ax.relim()
-            ax.autoscale_view()
-            ax.set_title(f'Mean Turns (best={min(mean_values):.2f})')
-            ax.figure.canvas.draw_idle()
+            if self.update_limits(ax, generations, mean_values, autoscale):
+                stale_canvases.add(ax.figure.canvas)
+            ax.set_title(f'Mean Turns (best={self.parser.best["mean"]:.2f})')
+            dirty_canvases.add(ax.figure.canvas)
         
         # Update variance plot
-        if variance_values:
-            self.lines['variance'].set_data(var_gens, variance_values)
+        if self.parser.best['variance'] < math.inf:
+            self.lines['variance'].set_data(generations, variance_values)
             ax = self.axes['variance']
-            ax.relim()
-            ax.autoscale_view()
-            ax.set_title(f'Variance (best={min(variance_values):.2f})')
-            ax.figure.canvas.draw_idle()
+            if self.update_limits(ax, generations, variance_values, autoscale):
+                stale_canvases.add(ax.figure.canvas)
+            ax.set_title(f'Variance (best={self.parser.best["variance"]:.2f})')
+            dirty_canvases.add(ax.figure.canvas)
         
         # Update P95 plot
-        if p95_values:
-            self.lines['p95'].set_data(p95_gens, p95_values)
+        if self.parser.best['p95'] < math.inf:
+            self.lines['p95'].set_data(generations, p95_values)
             ax = self.axes['p95']
-            ax.relim()
-            ax.autoscale_view()
-            ax.set_title(f'P95 Turns (best={min(p95_values):.1f})')
-            ax.figure.canvas.draw_idle()
+            if self.update_limits(ax, generations, p95_values, autoscale):
+                stale_canvases.add(ax.figure.canvas)
+            ax.set_title(f'P95 Turns (best={self.parser.best["p95"]:.1f})')
+            dirty_canvases.add(ax.figure.canvas)
         
         # Update max plot
-        if max_values:
-            self.lines['max'].set_data(max_gens, max_values)
+        if self.parser.best['max'] < math.inf:
+            self.lines['max'].set_data(generations, max_values)
             ax = self.axes['max']
-            ax.relim()
-            ax.autoscale_view()
-            ax.set_title(f'Max Turns (best={min(max_values):.0f})')
-            ax.figure.canvas.draw_idle()
+            if self.update_limits(ax, generations, max_values, autoscale):
+                stale_canvases.add(ax.figure.canvas)
+            ax.set_title(f'Max Turns (best={self.parser.best["max"]:.0f})')
+            dirty_canvases.add(ax.figure.canvas)
         
         # Update parameter plots and combined view
-        for param in self.parser.param_names:
-            gens = []
-            vals = []
-            for imp in improvements:
-                if param in imp['params']:
-                    gens.append(imp['generation'])
-                    vals.append(imp['params'][param])
+        for idx, param in enumerate(self.parser.param_names):
+            gen_arr = self.parser.param_gens[idx]
+            val_arr = self.parser.param_vals[idx]
             
-            if gens:
+            if len(gen_arr):
+                gens = gen_arr.view()
+                vals = val_arr.view()
+                
                 # Individual plot
-                self.lines[param].set_data(gens, vals)
-                ax = self.axes[param]
-                ax.relim()
-                ax.autoscale_view()
+                self.param_lines[idx].set_data(gens, vals)
+                ax = self.param_axes[idx]
+                if self.update_limits(ax, gens, vals, autoscale):
+                    stale_canvases.add(ax.figure.canvas)
                 ax.set_title(f'{param} = {vals[-1]:.3f}')
-                ax.figure.canvas.draw_idle()
+                dirty_canvases.add(ax.figure.canvas)
                 
                 # Combined plot
-                self.combined_lines[param].set_data(gens, vals)
+                self.combined_param_lines[idx].set_data(gens, vals)
+                if not autoscale and self.update_limits(self.combined_ax, gens, vals, False):
+                    stale_canvases.add(self.combined_canvas)
         
         # Update combined plot
-        self.combined_ax.relim()
-        self.combined_ax.autoscale_view()
-        self.combined_fig.suptitle(f'All Parameters Combined (Gen {generations[-1]}, n={len(improvements)})', fontsize=14)
-        self.combined_canvas.draw_idle()
+        if autoscale:
+            self.combined_ax.relim()
+            self.combined_ax.autoscale_view()
+            stale_canvases.add(self.combined_canvas)
+        self.combined_fig.suptitle(f'All Parameters Combined (Gen {generations[-1]:.0f}, n={n})', fontsize=14)
+        dirty_canvases.add(self.combined_canvas)
+        
+        for canvas in dirty_canvases:
+            if canvas in stale_canvases or canvas not in self.backgrounds:
+                canvas.draw_idle()
+            else:
+                self.blit(canvas)
         
         # Schedule next update
         if self.running:
@@ -415,7 +992,7 @@ class SimplePlotter:
         self.parser = parser
         self.update_interval = update_interval_ms
         self.last_improvement_count = 0
-        self.colors = plt.cm.tab20(np.linspace(0, 1, len(parser.param_names)))  # type: ignore
+        self.colors = _PALETTE
         
     def run(self):
         """Run with two separate matplotlib windows."""
@@ -479,29 +1056,32 @@ class SimplePlotter:
         # Animation
         def update(frame):
             self.parser.parse_incremental()
-            improvements = self.parser.improvements
+            n = len(self.parser.gen_arr)
             
-            if not improvements or len(improvements) == self.last_improvement_count:
+            if n == 0 or n == self.last_improvement_count:
                 return
             
-            self.last_improvement_count = len(improvements)
-            generations = [imp['generation'] for imp in improvements]
+            self.last_improvement_count = n
+            generations = self.parser.gen_arr.view()
             
             # Update metrics
-            metrics_keys = ['fitness', 'mean', 'variance', 'p95', 'max']
-            for idx, key in enumerate(metrics_keys):
-                vals = [imp[key] for imp in improvements if imp.get(key) is not None]
-                gens = [imp['generation'] for imp in improvements if imp.get(key) is not None]
-                if vals:
-                    self.lines[key].set_data(gens, vals)
+            metric_arrs = [
+                self.parser.fit_arr, self.parser.mean_arr, self.parser.var_arr,
+                self.parser.p95_arr, self.parser.max_arr
+            ]
+            for idx, (key, arr) in enumerate(zip(['fitness', 'mean', 'variance', 'p95', 'max'], metric_arrs)):
+                if self.parser.best[key] < math.inf:
+                    self.lines[key].set_data(generations, arr.view())
                     self.axes[idx].relim()
                     self.axes[idx].autoscale_view()
             
             # Update parameters
             for idx, param in enumerate(self.parser.param_names):
-                gens = [imp['generation'] for imp in improvements if param in imp['params']]
-                vals = [imp['params'][param] for imp in improvements if param in imp['params']]
-                if gens:
+                gen_arr = self.parser.param_gens[idx]
+                val_arr = self.parser.param_vals[idx]
+                if len(gen_arr):
+                    gens = gen_arr.view()
+                    vals = val_arr.view()
                     self.lines[param].set_data(gens, vals)
                     self.axes[idx + 5].relim()
                     self.axes[idx + 5].autoscale_view()
@@ -509,7 +1089,7 @@ class SimplePlotter:
             
             self.ax_combined.relim()
             self.ax_combined.autoscale_view()
-            self.ax_combined.set_title(f'All Parameters Combined (Gen {generations[-1]})')
+            self.ax_combined.set_title(f'All Parameters Combined (Gen {generations[-1]:.0f})')
             
             self.fig_combined.canvas.draw_idle()
             self.fig_individual.canvas.draw_idle()
@@ -523,23 +1103,25 @@ class SimplePlotter:
         plt.show()
 
 
-def print_summary(improvements):
+def print_summary(parser):
     """Print a summary of parameter evolution."""
     
-    if not improvements:
+    n = len(parser.gen_arr)
+    if not n:
         print("No improvements found.")
         return
     
     print(f"\n{'='*60}")
-    print(f"Found {len(improvements)} improvements")
+    print(f"Found {n} improvements")
     print(f"{'='*60}\n")
     
     # Print last few improvements
-    recent = improvements[-5:] if len(improvements) > 5 else improvements
+    recent = range(max(0, n - 5), n)
     print(f"Most recent {len(recent)} improvements:\n")
     
-    for i, imp in enumerate(recent):
-        idx = len(improvements) - len(recent) + i + 1
+    for row in recent:
+        imp = parser.improvement(row)
+        idx = row + 1
         p95_str = f", P95: {imp['p95']:.1f}" if imp.get('p95') is not None else ""
         max_str = f", Max: {imp['max']:.0f}" if imp.get('max') is not None else ""
         print(f"Improvement {idx} (Gen {imp['generation']}, Fitness: {imp['fitness']:.4f}, "
@@ -553,14 +1135,10 @@ def print_summary(improvements):
     print("Parameter Ranges Across All Improvements")
     print(f"{'='*60}\n")
     
-    all_params = set()
-    for imp in improvements:
-        all_params.update(imp['params'].keys())
-    
-    for param in sorted(all_params):
-        values = [imp['params'][param] for imp in improvements if param in imp['params']]
-        if values:
-            print(f"{param:25s}: min={min(values):8.4f}, max={max(values):8.4f}, "
+    for param in sorted(parser.param_index):
+        values = parser.param_vals[parser.param_index[param]].view()
+        if len(values):
+            print(f"{param:25s}: min={values.min():8.4f}, max={values.max():8.4f}, "
                   f"first={values[0]:8.4f}, last={values[-1]:8.4f}")
 
 
@@ -584,6 +1162,8 @@ def main():
     print("Close the plot window to exit.\n")
     
     parser = LogParser(log_file)
+    if parser.load_snapshot():
+        print(f"Resuming from snapshot with {len(parser.gen_arr)} improvements\n")
     
     # Use Tkinter-based scrollable plotter if available, otherwise fallback
     if HAS_TK:
@@ -594,9 +1174,14 @@ def main():
         plotter = SimplePlotter(parser, update_interval_ms=2000)
     
     plotter.run()
+    try:
+        parser.save_snapshot()
+    except OSError as e:
+        print(f"Could not save snapshot: {e}")
+    parser.close()
     
     # Print final summary when window is closed
-    print_summary(parser.improvements)
+    print_summary(parser)
 
 
 if __name__ == "__main__":
@@ -1,17 +1,46 @@
+# pyright: reportOptionalCall=false
+
+import functools
 import os
+import re
+import sys
+import matplotlib
+
+# --save [path] renders the overview to an image without opening a window
+SAVE_MODE = '--save' in sys.argv
+if SAVE_MODE:
+    matplotlib.use('Agg')
+
 import matplotlib.pyplot as plt
 import numpy as np
 from collections import defaultdict
 from datetime import datetime
 import matplotlib.dates as mdates
+from matplotlib.backend_bases import MouseButton
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from matplotlib.figure import Figure
 
+HAS_SCIPY = False
+try:
+    from scipy.ndimage import uniform_filter1d
+    HAS_SCIPY = True
+except ImportError:
+    uniform_filter1d = None  # type: ignore
+
+HAS_FAST_HISTOGRAM = False
+try:
+    from fast_histogram import histogram1d  # type: ignore
+    HAS_FAST_HISTOGRAM = True
+except ImportError:
+    histogram1d = None  # type: ignore
+
 results_dir = "simulation_results"
 
-strategy_data = defaultdict(list)
+strategy_data = {}
 current_mode = "all"
 selected_strategy = None
 fig: Figure | None = None
+no_data_title = None
 
 def parse_timestamp(filename):
     parts = filename.split('_')
@@ -26,56 +55,100 @@ def parse_timestamp(filename):
             return None
     return None
 
-def load_all_strategies():
-    strategy_files = defaultdict(list)
-    for filename in os.listdir(results_dir):
-        if filename.endswith(".txt"):
-            parts = filename.split('_')
-            if len(parts) >= 3:
-                strategy_name = '_'.join(parts[:-2])
-            else:
-                strategy_name = parts[0]
-            strategy_files[strategy_name].append(filename)
+TIMESTAMP_PATTERN = re.compile(r'_(\d{4})(\d{2})(\d{2})_(\d{2})(\d{2})(\d{2})\.txt$')
 
-    data = {}
-    for strategy_name, files in strategy_files.items():
-        files.sort(reverse=True)
-        latest_file = files[0]
-        
-        with open(os.path.join(results_dir, latest_file), "r") as file:
-            turns = [int(line.strip()) for line in file]
-            data[strategy_name] = turns
-    return data
+def parse_timestamps(filenames):
+    # Convert all stamped names in one NumPy datetime64 parse instead of a strptime call per file
+    matches = [TIMESTAMP_PATTERN.search(filename) for filename in filenames]
+    stamped = [match.groups() for match in matches if match]
+    try:
+        parsed = iter(np.array([f"{y}-{mo}-{d}T{h}:{mi}:{sec}" for y, mo, d, h, mi, sec in stamped],
+                               dtype='datetime64[s]').tolist())
+    except ValueError:
+        # An impossible date in some name; let strptime sort out each file
+        return [parse_timestamp(filename) for filename in filenames]
+    return [next(parsed) if match else parse_timestamp(filename) for filename, match in zip(filenames, matches)]
 
-def load_single_strategy(strategy_name):
-    strategy_files = []
-    for filename in os.listdir(results_dir):
-        if filename.endswith(".txt") and filename.startswith(strategy_name):
-            strategy_files.append(filename)
-    
-    if not strategy_files:
-        return {}
-    
-    strategy_files.sort()
-    
-    data = {}
-    for filename in strategy_files:
-        timestamp = parse_timestamp(filename)
+def list_result_files():
+    with os.scandir(results_dir) as it:
+        return [entry for entry in it if entry.name.endswith(".txt")]
+
+def load_results():
+    # One pass over the results directory: the runs of each strategy keyed by timestamp
+    # (file name when it has none), and the latest run of each strategy
+    strategy_runs = defaultdict(dict)
+    latest_runs = {}
+    latest_names = {}
+    entries = list_result_files()
+    timestamps = parse_timestamps([entry.name for entry in entries])
+    for entry, timestamp in zip(entries, timestamps):
+        parts = entry.name.split('_')
+        if len(parts) >= 3:
+            strategy_name = '_'.join(parts[:-2])
+        else:
+            strategy_name = parts[0]
+        # Turn counts are small, so int16 keeps the arrays compact for the histogram and stats passes
+        turns = np.loadtxt(entry.path, dtype=np.int16, ndmin=1)
+        # The array is shared between views, so guard it against in-place edits
+        turns.flags.writeable = False
         if timestamp:
-            with open(os.path.join(results_dir, filename), "r") as file:
-                turns = [int(line.strip()) for line in file]
-                data[timestamp] = turns
+            strategy_runs[strategy_name][timestamp] = turns
         else:
-            with open(os.path.join(results_dir, filename), "r") as file:
-                turns = [int(line.strip()) for line in file]
-                data[filename] = turns
-    
-    return data
+            strategy_runs[strategy_name][entry.name] = turns
+        # Names end in a fixed-width YYYYMMDD_HHMMSS stamp, so the greatest name is the latest run
+        if entry.name > latest_names.get(strategy_name, ''):
+            latest_names[strategy_name] = entry.name
+            latest_runs[strategy_name] = turns
+    return latest_runs, strategy_runs
+
+def load_all_strategies():
+    return latest_runs
+
+def load_single_strategy(strategy_name):
+    # No sort here: the plot orders runs by their parsed timestamps
+    return strategy_runs.get(strategy_name, {})
+
+def turn_histogram(turns, min_turns, max_turns, density=False):
+    # Turns are integers, so unit-width bins are just counts per value
+    n_bins = max_turns - min_turns + 1
+    if HAS_FAST_HISTOGRAM:
+        counts = histogram1d(turns, bins=n_bins, range=(min_turns, max_turns + 1))
+    else:
+        counts = np.bincount(turns - min_turns, minlength=n_bins)
+    if density:
+        return counts / counts.sum()
+    return counts
 
 def moving_average(data, window_size):
+    # Centered window, same length as data, edges extended with the nearest value
     if len(data) < window_size:
         return data
-    return np.convolve(data, np.ones(window_size) / window_size, mode='valid')
+    data = np.asarray(data, dtype=np.float64)
+    if HAS_SCIPY:
+        return uniform_filter1d(data, size=window_size, mode='nearest')
+    pad_before = window_size // 2
+    padded = np.pad(data, (pad_before, window_size - 1 - pad_before), mode='edge')
+    # Sliding window sums as differences of a running sum, O(N) for any window size
+    sums = np.cumsum(padded)
+    return (sums[window_size - 1:] - np.concatenate(([0.0], sums[:-window_size]))) / window_size
+
+@functools.lru_cache(maxsize=None)
+def run_colors(count):
+    # Gradient from the oldest to the newest run of a strategy
+    return plt.get_cmap('viridis')(np.linspace(0, 1, count))
+
+@functools.lru_cache(maxsize=None)
+def strategy_colors(count):
+    # tab10 has ten distinct colors, so index them instead of resampling the map
+    return plt.get_cmap('tab10')(np.arange(count) % 10)
+
+def smoothed_histogram(turns, min_turns, max_turns, density=False):
+    # Shared by both views: unit-bin counts (or densities) with a short moving average
+    hist = turn_histogram(turns, min_turns, max_turns, density)
+    window_size = min(5, len(hist))
+    if window_size > 1:
+        return moving_average(hist, window_size)
+    return hist
 
 def switch_to_single_strategy(strategy_name):
     global current_mode, strategy_data, selected_strategy
@@ -91,34 +164,99 @@ def switch_to_all_strategies():
     strategy_data = load_all_strategies()
     update_plot()
 
+def create_view(fig, mode):
+    # Axes of a view are created once and reused; hidden while the other view is shown
+    if mode == "single":
+        # replace two-row layout with three-row grid for hist, trend, and table
+        gs = fig.add_gridspec(3, 1, height_ratios=[2,2,1])
+        axes = [fig.add_subplot(gs[0, 0]), fig.add_subplot(gs[1, 0]), fig.add_subplot(gs[2, 0])]
+    else:
+        gs = fig.add_gridspec(2, 2)
+        axes = [fig.add_subplot(gs[0, :]), fig.add_subplot(gs[1, 0]), fig.add_subplot(gs[1, 1])]
+    return {'gridspec': gs, 'axes': axes, 'extra_axes': [], 'data': None, 'pickers': {}, 'sidebar': None, 'background': None}
+
+def show_view(fig, mode):
+    global current_view
+    if mode not in views:
+        views[mode] = create_view(fig, mode)
+    for name, view in views.items():
+        for ax in view['axes'] + view['extra_axes']:
+            ax.set_visible(name == mode)
+    current_view = views[mode]
+    return current_view
+
+def same_data(a, b):
+    # Result files are cached, so unchanged data is the very same arrays
+    return a is not None and a.keys() == b.keys() and all(a[key] is b[key] for key in b)
+
+def turn_box_stats(turns, stat):
+    # Box plot stats from the table's quartiles, with whiskers and fliers as Axes.boxplot draws them:
+    # whiskers reach the furthest turns within 1.5 IQR of the box
+    iqr = stat['q3'] - stat['q1']
+    low_limit = stat['q1'] - 1.5 * iqr
+    high_limit = stat['q3'] + 1.5 * iqr
+    whislo = stat['min'] if stat['min'] >= low_limit else turns[turns >= low_limit].min()
+    whishi = stat['max'] if stat['max'] <= high_limit else turns[turns <= high_limit].max()
+    whislo = min(whislo, stat['q1'])
+    whishi = max(whishi, stat['q3'])
+    if stat['min'] < whislo or stat['max'] > whishi:
+        fliers = turns[(turns < whislo) | (turns > whishi)]
+    else:
+        fliers = turns[:0]
+    return {'med': stat['median'], 'q1': stat['q1'], 'q3': stat['q3'],
+            'whislo': whislo, 'whishi': whishi, 'fliers': fliers}
+
 def update_plot():
-    global current_strategy_lines, fig
-    current_strategy_lines = {}
+    global current_strategy_lines, current_view, fig, no_data_title
     if fig is None:
         fig = plt.figure(figsize=(16, 10))
-    fig.clf()
     if not strategy_data:
-        fig.suptitle("No data available.", fontsize=16)
+        current_view = None
+        for view in views.values():
+            for ax in view['axes'] + view['extra_axes']:
+                ax.set_visible(False)
+        current_strategy_lines = {}
+        no_data_title = fig.suptitle("No data available.", fontsize=16)
+        no_data_title.set_visible(True)
         plt.draw()
         return
-    all_turns = [turn for turns in strategy_data.values() for turn in turns]
-    min_turns = min(all_turns)
-    max_turns = max(all_turns)
-    bins = np.arange(min_turns, max_turns + 2)
+    if no_data_title is not None:
+        no_data_title.set_visible(False)
+    view = show_view(fig, current_mode)
+    if same_data(view['data'], strategy_data):
+        # Nothing changed since this view was drawn, so just show it again
+        current_strategy_lines = view['pickers']
+        background = view['background']
+        canvas = fig.canvas
+        if background is not None and background[0] == fig.bbox.bounds and isinstance(canvas, FigureCanvasAgg):
+            # Paint the cached rendering of the view instead of redrawing every artist
+            canvas.restore_region(background[1])
+            canvas.blit(fig.bbox)
+        else:
+            plt.draw()
+        return
+    current_strategy_lines = {}
+    for ax in view['axes']:
+        ax.cla()
+    for ax in view['extra_axes']:
+        ax.remove()
+    view['extra_axes'] = []
+    # Start from the default layout, as a fresh figure would
+    view['gridspec'].update(left=None, bottom=None, right=None, top=None, wspace=None, hspace=None)
+    ax1, ax2, ax3 = view['axes']
+    # Reduce each array on its own rather than concatenating them all
+    min_turns = min(turns.min() for turns in strategy_data.values())
+    max_turns = max(turns.max() for turns in strategy_data.values())
+    bin_centers = np.arange(min_turns, max_turns + 1) + 0.5
     if current_mode == "single":
-        # replace two-row layout with three-row grid for hist, trend, and table
-        gs = fig.add_gridspec(3, 1, height_ratios=[2,2,1])
-        ax1 = fig.add_subplot(gs[0, 0])
-        ax2 = fig.add_subplot(gs[1, 0])
-        ax3 = fig.add_subplot(gs[2, 0])
-        colors = plt.get_cmap('viridis')(np.linspace(0, 1, len(strategy_data)))
+        colors = run_colors(len(strategy_data))
         time_stats = []
-        sorted_items = sorted(strategy_data.items())
+        sorted_items = sorted(strategy_data.items(), key=lambda item: item[0])
         for i, (timestamp, turns) in enumerate(sorted_items):
             color = colors[i]
-            average_turns = np.mean(turns)
+            average_turns = turns.mean()
             median_turns = np.median(turns)
-            std_turns = np.std(turns)
+            std_turns = turns.std()
             time_stats.append({
                 'timestamp': timestamp,
                 'avg': average_turns,
@@ -127,26 +265,17 @@ def update_plot():
                 'color': color,
                 'count': len(turns)
             })
-            hist, bin_edges = np.histogram(turns, bins=bins, density=True)
-            bin_centers = (bin_edges[:-1] + bin_edges[1:]) / 2
-            window_size = min(5, len(hist))
-            if window_size > 1:
-                smooth_hist = moving_average(hist, window_size)
-                smooth_bins = bin_centers[:len(smooth_hist)]
-            else:
-                smooth_hist = hist
-                smooth_bins = bin_centers
+            smooth_hist = smoothed_histogram(turns, min_turns, max_turns, density=True)
             if isinstance(timestamp, datetime):
                 time_label = timestamp.strftime("%m/%d %H:%M")
             else:
                 time_label = str(timestamp)[:20]
-            ax1.plot(smooth_bins, smooth_hist, label=time_label, color=color, linewidth=2)
+            ax1.plot(bin_centers, smooth_hist, label=time_label, color=color, linewidth=2)
         ax1.set_title(f'Normalized Distribution Evolution for {selected_strategy}', fontsize=14, fontweight='bold')
         ax1.set_xlabel('Number of Turns', fontsize=12)
         ax1.set_ylabel('Density', fontsize=12)
         ax1.legend(bbox_to_anchor=(1.05, 1), loc='upper left')
         ax1.grid(True, alpha=0.3)
-        time_stats.sort(key=lambda x: x['timestamp'])
         timestamps = [stat['timestamp'] for stat in time_stats]
         averages = [stat['avg'] for stat in time_stats]
         medians = [stat['median'] for stat in time_stats]
@@ -189,61 +318,50 @@ def update_plot():
         tbl.scale(1, 1.2)
 
         back_ax = fig.add_axes((0.85, 0.92, 0.12, 0.06))
+        view['extra_axes'].append(back_ax)
         back_ax.axis('off')
         back_btn = back_ax.text(0.5, 0.5, 'Back to Overview', fontsize=12, color='blue', ha='center', va='center', fontweight='bold', bbox=dict(facecolor='white', edgecolor='blue', boxstyle='round,pad=0.5'))
         back_btn.set_picker(True)
         current_strategy_lines[back_btn] = '__back__'
     else:
-        ax1 = fig.add_subplot(2, 2, (1, 2))
-        ax2 = fig.add_subplot(2, 2, 3)
-        ax3 = fig.add_subplot(2, 2, 4)
-        colors = plt.get_cmap('tab10')(np.linspace(0, 1, len(strategy_data)))
+        colors = strategy_colors(len(strategy_data))
+        # Mean, std, min and max of every strategy in single sweeps over the concatenated turns
+        run_counts = np.array([len(turns) for turns in strategy_data.values()])
+        run_starts = np.concatenate(([0], np.cumsum(run_counts)[:-1]))
+        flat_turns = np.concatenate(list(strategy_data.values()))
+        averages = np.add.reduceat(flat_turns, run_starts, dtype=np.float64) / run_counts
+        deviations = flat_turns - np.repeat(averages, run_counts)
+        stds = np.sqrt(np.add.reduceat(deviations * deviations, run_starts) / run_counts)
+        mins = np.minimum.reduceat(flat_turns, run_starts)
+        maxs = np.maximum.reduceat(flat_turns, run_starts)
         stats_summary = []
         for i, (strategy_name, turns) in enumerate(strategy_data.items()):
             color = colors[i]
-            hist, bin_edges = np.histogram(turns, bins=bins)
-            bin_centers = (bin_edges[:-1] + bin_edges[1:]) / 2
-            window_size = min(5, len(hist))
-            if window_size > 1:
-                smooth_hist = moving_average(hist, window_size)
-                smooth_bins = bin_centers[:len(smooth_hist)]
-            else:
-                smooth_hist = hist
-                smooth_bins = bin_centers
-            line, = ax1.plot(smooth_bins, smooth_hist, label=strategy_name, color=color, linewidth=2)
-            average_turns = np.mean(turns)
-            median_turns = np.median(turns)
-            std_turns = np.std(turns)
-            q1_turns = np.percentile(turns, 25)
-            q3_turns = np.percentile(turns, 75)
-            min_turn = min(turns)
-            max_turn = max(turns)
+            smooth_hist = smoothed_histogram(turns, min_turns, max_turns)
+            line, = ax1.plot(bin_centers, smooth_hist, label=strategy_name, color=color, linewidth=2)
+            q1_turns, median_turns, q3_turns = np.quantile(turns, [0.25, 0.5, 0.75])
             stats_summary.append({
                 'strategy': strategy_name,
-                'avg': average_turns,
+                'avg': averages[i],
                 'median': median_turns,
-                'std': std_turns,
+                'std': stds[i],
                 'q1': q1_turns,
                 'q3': q3_turns,
-                'min': min_turn,
-                'max': max_turn,
+                'min': mins[i],
+                'max': maxs[i],
                 'color': color,
-                'count': len(turns)
+                'count': run_counts[i]
             })
         ax1.set_title('Distribution of Turns for Different Strategies', fontsize=14, fontweight='bold')
         ax1.set_xlabel('Number of Turns', fontsize=12)
         ax1.set_ylabel('Frequency', fontsize=12)
         ax1.grid(True, alpha=0.3)
         stats_summary.sort(key=lambda x: x['avg'])
-        box_data = []
-        box_labels = []
-        box_colors = []
-        for stat in stats_summary:
-            turns = strategy_data[stat['strategy']]
-            box_data.append(turns)
-            box_labels.append(stat['strategy'])
-            box_colors.append(stat['color'])
-        bp = ax2.boxplot(box_data, patch_artist=True)
+        box_stats, box_labels, box_colors = zip(*(
+            (turn_box_stats(strategy_data[stat['strategy']], stat), stat['strategy'], stat['color'])
+            for stat in stats_summary
+        ))
+        bp = ax2.bxp(box_stats, patch_artist=True)
         ax2.set_title('Performance Comparison (Box Plot)', fontsize=12, fontweight='bold')
         ax2.set_xticklabels(box_labels)
         for patch, color in zip(bp['boxes'], box_colors):
@@ -284,15 +402,20 @@ def update_plot():
         sidebar_width = 0.12
         sidebar_height = ax1.get_position().height
         sidebar_ax = fig.add_axes((sidebar_left, sidebar_bottom, sidebar_width, sidebar_height))
+        view['extra_axes'].append(sidebar_ax)
         sidebar_ax.axis('off')
         sidebar_ax.set_title('Select Strategy', fontsize=12, fontweight='bold', pad=10)
         y_positions = np.linspace(0.95, 0.05, len(stats_summary))
+        labels = []
         for idx, stat in enumerate(stats_summary):
-            txt = sidebar_ax.text(0.5, y_positions[idx], stat['strategy'], fontsize=11, color=stat['color'], ha='center', va='center', fontweight='bold', bbox=dict(facecolor='white', edgecolor=stat['color'], boxstyle='round,pad=0.3'))
-            txt.set_picker(True)
-            current_strategy_lines[txt] = stat['strategy']
-    plt.tight_layout()
-    plt.subplots_adjust(right=0.85)
+            labels.append(sidebar_ax.text(0.5, y_positions[idx], stat['strategy'], fontsize=11, color=stat['color'], ha='center', va='center', fontweight='bold', bbox=dict(facecolor='white', edgecolor=stat['color'], boxstyle='round,pad=0.3')))
+        # Clicks are matched to the nearest label by position, see on_click
+        view['sidebar'] = (sidebar_ax, y_positions, labels, [stat['strategy'] for stat in stats_summary])
+    # Lay out only this view's grid; the hidden view keeps its own layout
+    view['gridspec'].tight_layout(fig)
+    view['gridspec'].update(right=0.85)
+    view['data'] = strategy_data
+    view['pickers'] = current_strategy_lines
     plt.draw()
 
 def on_pick(event):
@@ -303,17 +426,53 @@ def on_pick(event):
         else:
             switch_to_single_strategy(val)
 
+def on_draw(event):
+    # Keep the rendering of the shown view for blitting when it is picked again unchanged;
+    # it is only reused while the figure still has the size it was drawn at. Vector savefig
+    # draws through a temporary canvas that cannot copy regions, so those draws are skipped
+    canvas = event.canvas
+    if current_view is not None and isinstance(canvas, FigureCanvasAgg):
+        bbox = canvas.figure.bbox
+        current_view['background'] = (bbox.bounds, canvas.copy_from_bbox(bbox))
+
 def on_click(event):
-    pass
+    # Sidebar labels are not pickable artists; only the label nearest a click is hit-tested
+    if current_view is None or current_view['sidebar'] is None:
+        return
+    if event.button != MouseButton.LEFT:
+        return
+    toolbar = event.canvas.toolbar
+    if toolbar is not None and toolbar.mode != '':
+        # Zooming or panning
+        return
+    sidebar_ax, y_positions, labels, strategy_names = current_view['sidebar']
+    if event.inaxes is not sidebar_ax or event.ydata is None:
+        return
+    idx = np.abs(y_positions - event.ydata).argmin()
+    if labels[idx].contains(event)[0]:
+        switch_to_single_strategy(strategy_names[idx])
 
 def create_figure_and_plot():
     global fig
     fig = plt.figure(figsize=(16, 10))
     update_plot()
     fig.canvas.mpl_connect('pick_event', on_pick)
+    fig.canvas.mpl_connect('button_press_event', on_click)
+    fig.canvas.mpl_connect('draw_event', on_draw)
+    return fig
 
 current_strategy_lines = {}
+views = {}
+current_view = None
+# Result files are read once at startup; switching views only picks from these
+latest_runs, strategy_runs = load_results()
 strategy_data = load_all_strategies()
 fig = None
-create_figure_and_plot()
-plt.show()
+figure = create_figure_and_plot()
+if SAVE_MODE:
+    save_args = sys.argv[sys.argv.index('--save') + 1:]
+    save_path = save_args[0] if save_args else "strategy_overview.png"
+    figure.savefig(save_path)
+    print(f"Saved overview to {save_path}")
+else:
+    plt.show()